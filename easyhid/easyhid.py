@@ -7,8 +7,15 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import cffi
 import ctypes.util
-import platform
 import sys
+import threading
+import time
+import weakref
+
+try:
+    import queue
+except ImportError: # python2
+    import Queue as queue
 
 ffi = cffi.FFI()
 ffi.cdef("""
@@ -48,38 +55,138 @@ int hid_get_indexed_string (hid_device *device, int string_index, wchar_t *strin
 const wchar_t* hid_error (hid_device *device);
 """)
 
-if "Windows" in platform.platform():
-    try:
-        hidapi = ffi.dlopen('hidapi.dll')
-    except:
-        hidapi = ffi.dlopen(ctypes.util.find_library('hidapi.dll'))
-elif "Darwin" in platform.platform():
-    try:
-        hidapi = ffi.dlopen('hidapi')
-    except:
-        hidapi = ffi.dlopen(ctypes.util.find_library('hidapi'))
-else:
+def _load_hidapi():
+    """
+    Locate and load the hidapi shared library for the current platform.
+    """
+    if sys.platform == 'win32':
+        libname = 'hidapi.dll'
+    elif sys.platform == 'darwin':
+        libname = 'hidapi'
+    else:
+        libname = 'hidapi-hidraw'
+
     try:
-        hidapi = ffi.dlopen('hidapi-hidraw')
+        lib = ffi.dlopen(libname)
     except:
-        libname = ctypes.util.find_library('hidapi-hidraw')
+        libpath = ctypes.util.find_library(libname)
 
-        if sys.version_info < (3, 6) and libname == None:
+        if sys.platform not in ('win32', 'darwin') and \
+                sys.version_info < (3, 6) and libpath == None:
             # Couldn't find lib, use hardcode value so AppImage works.
             # Not need in >= 3.6 since ctypes.util.find_library will also
             # check LD_LIBRARY_PATH in newer versions of python.
-            libname = 'libhidapi-hidraw.so.0'
-        hidapi = ffi.dlopen(libname)
+            libpath = 'libhidapi-hidraw.so.0'
+        lib = ffi.dlopen(libpath)
 
-def _c_to_py_str(val):
+    return lib
+
+class _LazyHIDAPI(object):
+    """
+    Loads the hidapi library the first time one of its functions is used.
+
+    Looked up functions are stored on the instance, so after the first call
+    they are found without going through `__getattr__` again.
+    """
+
+    _lib = None
+
+    def __getattr__(self, name):
+        if self._lib is None:
+            _LazyHIDAPI._lib = _load_hidapi()
+        fn = getattr(self._lib, name)
+        setattr(self, name, fn)
+        return fn
+
+hidapi = _LazyHIDAPI()
+
+def _decode_str(val):
+    if type(val) == bytes or type(val) == bytearray:
+        return val.decode("utf-8")
+    else:
+        return val
+
+def _c_to_raw_str(val):
     if val == ffi.NULL:
         return None
 
-    new_val = ffi.string(val)
-    if type(new_val) == bytes or type(new_val) == bytearray:
-        return new_val.decode("utf-8")
+    return ffi.string(val)
+
+def _c_to_py_str(val):
+    return _decode_str(_c_to_raw_str(val))
+
+# Size in characters of the buffer used to read string descriptors
+_MAX_STR_LEN = 128
+
+# Results of recent enumerations, mapping (vid, pid) to (timestamp, table)
+_ENUM_CACHE = {}
+# How long in seconds an enumeration can be reused for. 0 disables the cache.
+_ENUM_CACHE_TTL = 0
+
+_monotonic = getattr(time, 'monotonic', time.time)
+_SimpleQueue = getattr(queue, 'SimpleQueue', queue.Queue)
+# Not available before python 3.4, `HIDDevice.__del__` is used instead
+_finalize = getattr(weakref, 'finalize', None)
+
+def set_enumeration_cache_ttl(ttl):
+    """
+    Set how long the results of an enumeration are reused for.
+
+    Creating an `Enumeration` has to walk all the HID devices on the system,
+    so applications that enumerate often can let `Enumeration` objects for
+    the same VID:PID share the device list for up to `ttl` seconds. Devices
+    that are plugged in or removed within that window will not be seen until
+    the cached result expires.
+
+    Parameters:
+        ttl: time in seconds to reuse an enumeration, or 0 to always
+            enumerate the devices (the default).
+    """
+    global _ENUM_CACHE_TTL
+    if ttl < 0:
+        raise ValueError("ttl must not be negative")
+    _ENUM_CACHE_TTL = ttl
+    _ENUM_CACHE.clear()
+
+# Template used by `HIDDevice.description()`
+_DESCRIPTION_FORMAT = """HIDDevice:
+    {0.path} | {0.vendor_id:x}:{0.product_id:x} | {0.manufacturer_string} | {0.product_string} | {0.serial_number}
+    release_number: {0.release_number}
+    usage_page: {0.usage_page}
+    usage: {0.usage}
+    interface_number: {0.interface_number}\
+"""
+
+def _fill_report_buf(buf, data, report_id):
+    """
+    Copy the report ID followed by `data` into the C buffer `buf`, replacing
+    it with a larger buffer if the report doesn't fit (or `buf` is None).
+
+    Returns:
+        A tuple of the C buffer and the number of bytes in the report.
+    """
+    # Buffer objects are copied straight into the C buffer, anything else
+    # (e.g. a list of ints) has to be converted first.
+    if isinstance(data, (bytes, bytearray)):
+        data_len = len(data)
+    elif isinstance(data, memoryview) and getattr(data, 'c_contiguous', False):
+        # `c_contiguous` and `nbytes` only exist in python >= 3.3
+        data_len = data.nbytes
     else:
-        return new_val
+        data = bytearray(data)
+        data_len = len(data)
+    length = 1 + data_len
+
+    if buf is None or len(buf) < length:
+        buf = ffi.new("unsigned char[]", length)
+
+    buf[0] = report_id
+    ffi.memmove(buf + 1, data, data_len)
+    return buf, length
+
+def _close_hidapi_handle(device):
+    if device:
+        hidapi.hid_close(device)
 
 class HIDException(Exception):
     pass
@@ -91,25 +198,94 @@ class HIDDevice(object):
     Should normally be created through an Enumeration object.
     """
 
+    __slots__ = (
+        'path',
+        'vendor_id',
+        'product_id',
+        'release_number',
+        'manufacturer_string',
+        'product_string',
+        'serial_number',
+        'usage_page',
+        'usage',
+        'interface_number',
+        '_path_bytes',
+        '_device',
+        '_finalizer',
+        '_is_open',
+        '_nonblocking',
+        '_read_buf',
+        '_read_buf_size',
+        '_write_buf',
+        '_str_buf',
+        '__weakref__',
+    )
+
     def __init__(self, cdata):
         if cdata == ffi.NULL:
             raise TypeError
-        self.path = _c_to_py_str(cdata.path)
-        self.vendor_id = cdata.vendor_id
-        self.product_id = cdata.product_id
-        self.release_number = cdata.release_number
-        self.manufacturer_string = _c_to_py_str(cdata.manufacturer_string)
-        self.product_string = _c_to_py_str(cdata.product_string)
-        self.serial_number = _c_to_py_str(cdata.serial_number)
-        self.usage_page = cdata.usage_page
-        self.usage = cdata.usage
-        self.interface_number = cdata.interface_number
+        self._init_info(
+            _c_to_raw_str(cdata.path),
+            cdata.vendor_id,
+            cdata.product_id,
+            cdata.release_number,
+            _c_to_raw_str(cdata.manufacturer_string),
+            _c_to_raw_str(cdata.product_string),
+            _c_to_raw_str(cdata.serial_number),
+            cdata.usage_page,
+            cdata.usage,
+            cdata.interface_number,
+        )
+
+    @classmethod
+    def _from_table(cls, table, index):
+        """
+        Create a `HIDDevice` from row `index` of a `_DeviceTable`.
+        """
+        dev = cls.__new__(cls)
+        dev._init_info(
+            table.path[index],
+            table.vendor_id[index],
+            table.product_id[index],
+            table.release_number[index],
+            table.manufacturer_string[index],
+            table.product_string[index],
+            table.serial_number[index],
+            table.usage_page[index],
+            table.usage[index],
+            table.interface_number[index],
+        )
+        return dev
+
+    def _init_info(self, path, vendor_id, product_id, release_number,
+                   manufacturer_string, product_string, serial_number,
+                   usage_page, usage, interface_number):
+        # The undecoded path is kept to pass back to hidapi
+        self._path_bytes = path
+        self.path = _decode_str(path)
+        self.vendor_id = vendor_id
+        self.product_id = product_id
+        self.release_number = release_number
+        self.manufacturer_string = _decode_str(manufacturer_string)
+        self.product_string = _decode_str(product_string)
+        self.serial_number = _decode_str(serial_number)
+        self.usage_page = usage_page
+        self.usage = usage
+        self.interface_number = interface_number
 
         self._device = None
+        self._finalizer = None
         self._is_open = False
+        self._nonblocking = False
+        self._read_buf = None
+        self._read_buf_size = 0
+        self._write_buf = None
+        self._str_buf = None
 
-    def __del__(self):
-        self.close()
+    if _finalize is None:
+        def __del__(self):
+            if self._is_open:
+                self.close()
 
     def __enter__(self):
         self.open()
@@ -124,13 +300,19 @@ class HIDDevice(object):
         if self._is_open:
             raise HIDException("Failed to open device: HIDDevice already open")
 
-        path = self.path.encode('utf-8')
-        dev = hidapi.hid_open_path(path)
+        dev = hidapi.hid_open_path(self._path_bytes)
 
         if dev:
             self._is_open = True
+            self._nonblocking = False
             self._device = dev
+            # Close the handle if the object is garbage collected while open
+            if _finalize is not None:
+                self._finalizer = _finalize(self, _close_hidapi_handle, dev)
         else:
+            # The device might have been removed, so don't keep reusing
+            # enumerations that could still contain it.
+            _ENUM_CACHE.clear()
             raise HIDException("Failed to open device")
 
 
@@ -140,7 +322,13 @@ class HIDDevice(object):
         """
         if self._is_open:
             self._is_open = False
-            hidapi.hid_close(self._device)
+            if self._finalizer is not None:
+                # Runs `_close_hidapi_handle()`, and stops it from running
+                # again when the object is garbage collected.
+                self._finalizer()
+                self._finalizer = None
+            else:
+                _close_hidapi_handle(self._device)
 
     def write(self, data, report_id=0):
         """
@@ -157,14 +345,31 @@ class HIDDevice(object):
         if not self._is_open:
             raise HIDException("HIDDevice not open")
 
-        write_data = bytearray([report_id]) + bytearray(data)
-        cdata = ffi.new("const unsigned char[]", bytes(write_data))
-        num_written = hidapi.hid_write(self._device, cdata, len(write_data))
+        cdata, length = self._fill_write_buf(data, report_id)
+        num_written = hidapi.hid_write(self._device, cdata, length)
         if num_written < 0:
             raise HIDException("Failed to write to HID device: " + str(num_written))
         else:
             return num_written
 
+    def _fill_write_buf(self, data, report_id):
+        """
+        Copy the report ID followed by `data` into the reusable write buffer.
+
+        Returns:
+            A tuple of the C buffer and the number of bytes in the report.
+        """
+        self._write_buf, length = _fill_report_buf(self._write_buf, data, report_id)
+        return self._write_buf, length
+
+    def _get_read_buf(self, size):
+        # Reuse the same C buffer between reads, only growing it when a
+        # larger read is requested.
+        if self._read_buf is None or self._read_buf_size < size:
+            self._read_buf = ffi.new("unsigned char[]", size)
+            self._read_buf_size = size
+        return self._read_buf
+
     def read(self, size=64, timeout=None):
         """
         Read from the hid device on its endpoint.
@@ -182,14 +387,13 @@ class HIDDevice(object):
         if not self._is_open:
             raise HIDException("HIDDevice not open")
 
-        data = [0] * size
-        cdata = ffi.new("unsigned char[]", data)
+        cdata = self._get_read_buf(size)
         bytes_read = None
 
         if timeout == None:
-            bytes_read = hidapi.hid_read(self._device, cdata, len(cdata))
+            bytes_read = hidapi.hid_read(self._device, cdata, size)
         else:
-            bytes_read = hidapi.hid_read_timeout(self._device, cdata, len(cdata), timeout)
+            bytes_read = hidapi.hid_read_timeout(self._device, cdata, size, timeout)
 
 
         if bytes_read < 0:
@@ -197,7 +401,44 @@ class HIDDevice(object):
         elif bytes_read == 0:
             return bytearray([])
         else:
-            return bytearray(cdata)
+            return bytearray(ffi.buffer(cdata, bytes_read))
+
+    def read_all(self, size=64, max_reports=16):
+        """
+        Read all the reports that are waiting to be read from the device.
+
+        Does not wait for new reports to arrive, so if the device has not sent
+        anything since the last read, an empty list is returned.
+
+        Parameters:
+            size: maximum number of bytes in each report
+            max_reports: maximum number of reports to read
+
+        Returns:
+            A list of the HID reports read from the device, oldest first.
+        """
+        if not self._is_open:
+            raise HIDException("HIDDevice not open")
+
+        cdata = self._get_read_buf(size)
+        reports = []
+
+        was_nonblocking = self._nonblocking
+        if not was_nonblocking:
+            hidapi.hid_set_nonblocking(self._device, 1)
+        try:
+            while len(reports) < max_reports:
+                bytes_read = hidapi.hid_read(self._device, cdata, size)
+                if bytes_read < 0:
+                    raise HIDException("Failed to read from HID device: " + str(bytes_read))
+                elif bytes_read == 0:
+                    break
+                reports.append(bytearray(ffi.buffer(cdata, bytes_read)))
+        finally:
+            if not was_nonblocking:
+                hidapi.hid_set_nonblocking(self._device, 0)
+
+        return reports
 
     def set_nonblocking(self, enable_nonblocking):
         if not self._is_open:
@@ -206,6 +447,7 @@ class HIDDevice(object):
         if type(enable_nonblocking) != bool:
             raise TypeError
         hidapi.hid_set_nonblocking(self._device, enable_nonblocking)
+        self._nonblocking = enable_nonblocking
 
     def is_open(self):
         """Check if the HID device is open"""
@@ -222,6 +464,18 @@ class HIDDevice(object):
             else:
                 return True
         else:
+            # Try to open the device first, since that is much cheaper than
+            # enumerating every HID device on the system.
+            dev = hidapi.hid_open_path(self._path_bytes)
+            if dev:
+                hidapi.hid_close(dev)
+                return True
+
+            # Opening can also fail for a connected device, e.g. when we
+            # don't have permission to access it, so check the enumeration.
+            # The failed open may also mean the device was removed, so don't
+            # let a cached enumeration answer.
+            _ENUM_CACHE.clear()
             en = Enumeration(vid=self.vendor_id, pid=self.product_id).find(path=self.path)
             if len(en) == 0:
                 return False
@@ -244,9 +498,8 @@ class HIDDevice(object):
         if not self._is_open:
             raise HIDException("HIDDevice not open")
 
-        report = bytearray([report_id]) + bytearray(data)
-        cdata = ffi.new("const unsigned char[]", bytes(report))
-        bytes_written = hidapi.hid_send_feature_report(self._device, cdata, len(report))
+        cdata, length = self._fill_write_buf(data, report_id)
+        bytes_written = hidapi.hid_send_feature_report(self._device, cdata, length)
 
         if bytes_written == -1:
             raise HIDException("Failed to send feature report to HID device")
@@ -265,35 +518,35 @@ class HIDDevice(object):
             report_id   The report id to read
 
         Returns:
-            They bytes read from the HID report
+            The bytes read from the HID report, excluding the report ID
         """
-        data = [0] * (size+1)
-        cdata = ffi.new("unsigned char[]", bytes(data))
+        cdata = ffi.new("unsigned char[]", size+1)
         cdata[0] = report_id
 
-        bytes_read = hidapi.hid_get_feature_report(self._device, cdata, len(cdata))
+        bytes_read = hidapi.hid_get_feature_report(self._device, cdata, size+1)
 
         if bytes_read == -1:
             raise HIDException("Failed to get feature report from HID device")
 
-        return bytearray(cdata[1:size+1])
+        # `bytes_read` includes the report ID, which is not returned
+        return bytearray(ffi.buffer(cdata, bytes_read)[1:])
 
     def get_error(self):
         """
         Get an error string from the device
         """
-        err_str = hidapi.hid_error(self._device)
-        if err_str == ffi.NULL:
-            return None
-        else:
-            return ffi.string(err_str)
+        return _c_to_py_str(hidapi.hid_error(self._device))
+
+    def _get_str_buf(self):
+        if self._str_buf is None:
+            self._str_buf = ffi.new("wchar_t[]", _MAX_STR_LEN)
+        return self._str_buf
 
     def _get_prod_string_common(self, hid_fn):
-        max_len = 128
-        str_buf = ffi.new("wchar_t[]", bytearray(max_len).decode('utf-8'))
-        ret = hid_fn(self._device, str_buf, max_len)
+        str_buf = self._get_str_buf()
+        ret = hid_fn(self._device, str_buf, _MAX_STR_LEN)
         if ret < 0:
-            raise HIDException(self._device.get_error())
+            raise HIDException(self.get_error())
         else:
             assert(ret == 0)
             return ffi.string(str_buf)
@@ -322,40 +575,221 @@ class HIDDevice(object):
         """
         Get the string with the given index from the device
         """
-        max_len = 128
-        str_buf = ffi.new("wchar_t[]", str(bytearray(max_len)))
-        ret = hidapi.hid_get_indexed_string(self._device, index, str_buf, max_len)
+        str_buf = self._get_str_buf()
+        ret = hidapi.hid_get_indexed_string(self._device, index, str_buf, _MAX_STR_LEN)
 
         if ret < 0:
-            raise HIDException(self._device.get_error())
-        elif ret == 0:
-            return None
+            raise HIDException(self.get_error())
         else:
-            return ffi.string(str_buf).encode('utf-8')
+            # hidapi returns 0 on success
+            return ffi.string(str_buf)
 
 
     def description(self):
         """
         Get a string describing the HID descriptor.
         """
-        return \
-"""HIDDevice:
-    {} | {:x}:{:x} | {} | {} | {}
-    release_number: {}
-    usage_page: {}
-    usage: {}
-    interface_number: {}\
-""".format(self.path,
-           self.vendor_id,
-           self.product_id,
-           self.manufacturer_string,
-           self.product_string,
-           self.serial_number,
-           self.release_number,
-           self.usage_page,
-           self.usage,
-           self.interface_number
+        return _DESCRIPTION_FORMAT.format(self)
+
+class _AsyncIO(object):
+    """
+    The I/O thread of an open `HIDDeviceAsync` and the state it shares with
+    the device.
+
+    The thread only references this object and not the `HIDDeviceAsync`, so
+    a device that is dropped without being closed can still be garbage
+    collected. It also uses its own C buffers, so the device's other
+    methods can be used at the same time.
+    """
+
+    def __init__(self, device, report_size, poll_interval):
+        self.device = device
+        self.report_size = report_size
+        self.poll_interval = poll_interval
+        self.read_queue = _SimpleQueue()
+        self.write_queue = _SimpleQueue()
+        self.error = None
+        self.stop_event = threading.Event()
+        self.close_on_exit = False
+        self.thread = threading.Thread(target=self._run)
+        self.thread.daemon = True
+
+    def _run(self):
+        read_buf = ffi.new("unsigned char[]", self.report_size)
+        write_buf = None
+        try:
+            while not self.stop_event.is_set():
+                while True:
+                    try:
+                        data, report_id = self.write_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    write_buf, length = _fill_report_buf(write_buf, data, report_id)
+                    num_written = hidapi.hid_write(self.device, write_buf, length)
+                    if num_written < 0:
+                        raise HIDException("Failed to write to HID device: " + str(num_written))
+
+                bytes_read = hidapi.hid_read_timeout(
+                    self.device, read_buf, self.report_size, self.poll_interval
+                )
+                if bytes_read < 0:
+                    raise HIDException("Failed to read from HID device: " + str(bytes_read))
+                elif bytes_read > 0:
+                    self.read_queue.put(bytearray(ffi.buffer(read_buf, bytes_read)))
+        except Exception as err:
+            self.error = err
+            # wake up any `async_read()` that is waiting for a report
+            self.read_queue.put(None)
+        finally:
+            if self.close_on_exit:
+                _close_hidapi_handle(self.device)
+
+    def close(self):
+        """
+        Stop the I/O thread and close the device handle.
+        """
+        self.stop_event.set()
+        if threading.current_thread() is self.thread:
+            # The device was garbage collected on the I/O thread itself, so
+            # it has to close the handle once it stops.
+            self.close_on_exit = True
+        else:
+            self.thread.join()
+            _close_hidapi_handle(self.device)
+
+class HIDDeviceAsync(HIDDevice):
+    """
+    A HID device that reads and writes reports on a background thread.
+
+    While the device is open, an I/O thread sends the reports passed to
+    `async_write()` as soon as it picks them up and queues the reports it
+    receives from the device for `async_read()`. The blocking `read()` and
+    `write()` methods should not be used while the device is open.
+
+    Use `HIDDeviceAsync.from_device()` to create one from a `HIDDevice` found
+    through an `Enumeration`.
+    """
+
+    __slots__ = (
+        '_report_size',
+        '_poll_interval',
+        '_io',
+    )
+
+    def __init__(self, cdata, report_size=64, poll_interval=1):
+        super(HIDDeviceAsync, self).__init__(cdata)
+        self._init_async(report_size, poll_interval)
+
+    @classmethod
+    def from_device(cls, device, report_size=64, poll_interval=1):
+        """
+        Create a `HIDDeviceAsync` for the same HID interface as `device`.
+
+        Parameters:
+            device: a `HIDDevice`, normally from `Enumeration.find()`
+            report_size: maximum number of bytes in each report read
+            poll_interval: time in milliseconds the I/O thread waits for a
+                report before checking for reports to write
+        """
+        dev = cls.__new__(cls)
+        dev._init_info(
+            device._path_bytes,
+            device.vendor_id,
+            device.product_id,
+            device.release_number,
+            device.manufacturer_string,
+            device.product_string,
+            device.serial_number,
+            device.usage_page,
+            device.usage,
+            device.interface_number,
         )
+        dev._init_async(report_size, poll_interval)
+        return dev
+
+    def _init_async(self, report_size, poll_interval):
+        if poll_interval < 0:
+            raise ValueError("poll_interval must not be negative")
+        self._report_size = report_size
+        self._poll_interval = poll_interval
+        self._io = None
+
+    def open(self):
+        """
+        Open the HID device and start its I/O thread.
+        """
+        super(HIDDeviceAsync, self).open()
+        # Each time the device is opened it gets new queues, so nothing is
+        # left over from the last time it was open.
+        self._io = _AsyncIO(self._device, self._report_size, self._poll_interval)
+        self._io.thread.start()
+        if self._finalizer is not None:
+            # The I/O thread has to be stopped before the handle is closed
+            self._finalizer.detach()
+            self._finalizer = _finalize(self, self._io.close)
+
+    def close(self):
+        """
+        Stop the I/O thread and close the HID device.
+        """
+        if self._is_open:
+            self._is_open = False
+            if self._finalizer is not None:
+                # Runs `_AsyncIO.close()`, and stops it from running again
+                # when the object is garbage collected.
+                self._finalizer()
+                self._finalizer = None
+            else:
+                self._io.close()
+            self._io = None
+
+    def _check_io_error(self):
+        if not self._is_open:
+            raise HIDException("HIDDevice not open")
+        if self._io.error is not None:
+            raise self._io.error
+
+    def async_write(self, data, report_id=0):
+        """
+        Queue a report to be written to the device by the I/O thread.
+
+        Parameters:
+            data: data to send on the HID endpoint
+            report_id: the report ID to use.
+        """
+        self._check_io_error()
+        if not 0 <= report_id <= 0xff:
+            raise ValueError("report_id must be in the range 0-255")
+        # Take a copy, since `data` may be changed before it is written
+        if not isinstance(data, bytes):
+            data = bytes(bytearray(data))
+        self._io.write_queue.put((data, report_id))
+
+    def async_read(self, timeout=None):
+        """
+        Get the next report received by the I/O thread.
+
+        Parameters:
+            timeout: length to wait in milliseconds. None or a negative value
+                waits until a report is received, like `read()`.
+
+        Returns:
+            The HID report read from the device, or an empty bytearray if no
+            report was received before the timeout.
+        """
+        self._check_io_error()
+        io = self._io
+        try:
+            if timeout == None or timeout < 0:
+                report = io.read_queue.get()
+            else:
+                report = io.read_queue.get(timeout=timeout / 1000)
+        except queue.Empty:
+            return bytearray([])
+
+        if report is None:
+            raise io.error
+        return report
 
 class Enumeration(object):
     def __init__(self, vid=0, pid=0):
@@ -363,14 +797,49 @@ class Enumeration(object):
         Create a USB HID enumeration. The enumeration is a list of all the HID
         interfaces connected at the time the object was created.
         """
-        self.device_list = _hid_enumerate(vid, pid)
+        key = (vid, pid)
+        cached = _ENUM_CACHE.get(key)
+        now = _monotonic()
+        if cached is not None and now - cached[0] < _ENUM_CACHE_TTL:
+            self._table = cached[1]
+        else:
+            self._table = _hid_enumerate(vid, pid)
+            if _ENUM_CACHE_TTL > 0:
+                _ENUM_CACHE[key] = (now, self._table)
+        # `HIDDevice` objects are only created once they are needed
+        self._devices = [None] * len(self._table)
+        self._device_list = None
+
+    @property
+    def device_list(self):
+        """
+        A list of `HIDDevice` objects for every device in the `Enumeration`.
+
+        The list is created the first time it is used. After that `find()`
+        searches this list, so changes made to it are taken into account.
+        """
+        if self._device_list is None:
+            self._device_list = [self._get_device(i) for i in range(len(self._table))]
+        return self._device_list
+
+    @device_list.setter
+    def device_list(self, devices):
+        self._device_list = devices
+
+    def _get_device(self, index):
+        dev = self._devices[index]
+        if dev is None:
+            dev = HIDDevice._from_table(self._table, index)
+            self._devices[index] = dev
+        return dev
 
     def show(self):
         """
         Print the device description of each device in the Enumeration
         """
-        for dev in self.device_list:
-            print(dev.description())
+        devices = self.device_list
+        if devices:
+            print("\n".join(dev.description() for dev in devices))
 
     def find(self, vid=None, pid=None, serial=None, interface=None, \
             path=None, release_number=None, manufacturer=None,
@@ -392,53 +861,171 @@ class Enumeration(object):
             usage_page: filters by HID usage_page
             path: filters by HID API path.
         """
-        result = []
-
-        for dev in self.device_list:
-            if vid not in [0, None] and dev.vendor_id != vid:
-                continue
-            if pid not in [0, None] and dev.product_id != pid:
-                continue
-            if serial and dev.serial_number != serial:
-                continue
-            if path and dev.path != path:
-                continue
-            if manufacturer and dev.manufacturer_string != manufacturer:
-                continue
-            if product and dev.product_string != product:
-                continue
-            if release_number != None and dev.release_number != release_number:
-                continue
-            if interface != None and dev.interface_number != interface:
-                continue
-            if usage != None and dev.usage != usage:
-                continue
-            if usage_page != None and dev.usage_page != usage_page:
-                continue
-            result.append(dev)
-        return result
+        # Only the filters that are in use are checked. Integer fields are
+        # compared first since they are cheaper than the string fields.
+        filters = []
+        if vid not in [0, None]:
+            filters.append(('vendor_id', vid))
+        if pid not in [0, None]:
+            filters.append(('product_id', pid))
+        if interface != None:
+            filters.append(('interface_number', interface))
+        if usage != None:
+            filters.append(('usage', usage))
+        if usage_page != None:
+            filters.append(('usage_page', usage_page))
+        if release_number != None:
+            filters.append(('release_number', release_number))
+        if serial:
+            filters.append(('serial_number', serial))
+        if manufacturer:
+            filters.append(('manufacturer_string', manufacturer))
+        if product:
+            filters.append(('product_string', product))
+        if path:
+            # paths are compared undecoded
+            filters.append(('path', path.encode('utf-8')))
+
+        match_rows = _get_row_matcher(len(filters))
+
+        if self._device_list is None:
+            # `HIDDevice` objects are only created for the devices that match.
+            table = self._table
+            args = []
+            for name, value in filters:
+                args += [getattr(table, name), value]
+            rows = match_rows(len(table), *args)
+            return [self._get_device(i) for i in rows]
+        else:
+            # `device_list` may have been changed, so search it instead
+            devices = self._device_list
+            args = []
+            for name, value in filters:
+                attr = '_path_bytes' if name == 'path' else name
+                args += [[getattr(dev, attr) for dev in devices], value]
+            rows = match_rows(len(devices), *args)
+            return [devices[i] for i in rows]
 
 
-def _hid_enumerate(vendor_id=0, product_id=0):
+# Functions generated by `_get_row_matcher()`, keyed by the number of filters
+_ROW_MATCHERS = {}
+
+def _get_row_matcher(num_filters):
     """
-    Enumerates all the hid devices for VID:PID. Returns a list of `HIDDevice`
-    objects.  If vid is 0, then match any vendor id. Similarly, if pid is 0,
-    match any product id. If both are zero, enumerate all HID devices.
+    Get a function that returns the indices of the rows of a set of columns
+    (e.g. from a `_DeviceTable`) that match `num_filters` filters.
+
+    The returned function takes the number of rows followed by a column and
+    value for each filter, e.g. for two filters:
+
+        def match_rows(n, c0, v0, c1, v1):
+            return [i for i in range(n) if c0[i] == v0 and c1[i] == v1]
+
+    Generating the function means the comparisons for each row are a single
+    expression, without looping over the filters or checking which of them
+    are in use.
     """
-    start = hidapi.hid_enumerate(vendor_id, product_id)
-    result = []
-    cur = ffi.new("struct hid_device_info*");
-    cur = start
+    match_rows = _ROW_MATCHERS.get(num_filters)
+    if match_rows is None:
+        args = "".join(", c{0}, v{0}".format(i) for i in range(num_filters))
+        cond = " and ".join("c{0}[i] == v{0}".format(i) for i in range(num_filters))
+        source = "def match_rows(n{}):\n    return [i for i in range(n){}]\n".format(
+            args, " if " + cond if cond else ""
+        )
+        namespace = {}
+        exec(source, namespace)
+        match_rows = namespace['match_rows']
+        _ROW_MATCHERS[num_filters] = match_rows
+    return match_rows
 
-    # Copy everything into python list
-    while cur != ffi.NULL:
-        result.append(HIDDevice(cur))
-        cur = cur.next
+def enumerate_many(vid_pid_list):
+    """
+    Find the HID devices for several VID:PID pairs with a single enumeration.
+
+    Each call to `Enumeration(vid, pid)` walks every HID device on the system,
+    so checking for several different devices this way repeats the same work
+    once per pair. This function enumerates the devices once and splits the
+    result by VID:PID.
+
+    Parameters:
+        vid_pid_list: an iterable of (vid, pid) tuples. As with
+            `Enumeration`, a vid or pid of 0 matches any value.
+
+    Returns:
+        A dict mapping each (vid, pid) tuple to a list of `HIDDevice` objects.
+    """
+    en = Enumeration()
+    return {
+        (vid, pid): en.find(vid=vid, pid=pid) for (vid, pid) in vid_pid_list
+    }
+
+
+class _DeviceTable(object):
+    """
+    Column oriented copy of the device information returned by hidapi.
+
+    Each field of `struct hid_device_info` is stored in its own list. String
+    fields are copied out of the C structures but are not decoded.
+    """
+
+    def __init__(self, start):
+        # Count the devices first so every column can be allocated at once
+        count = 0
+        cur = start
+        while cur != ffi.NULL:
+            count += 1
+            cur = cur.next
+
+        self.path = [None] * count
+        self.vendor_id = [0] * count
+        self.product_id = [0] * count
+        self.release_number = [0] * count
+        self.manufacturer_string = [None] * count
+        self.product_string = [None] * count
+        self.serial_number = [None] * count
+        self.usage_page = [0] * count
+        self.usage = [0] * count
+        self.interface_number = [0] * count
+
+        # Each interface of a composite device has its own copy of the
+        # device's strings, so share one object for equal strings.
+        strings = {}
+
+        cur = start
+        for i in range(count):
+            self.path[i] = _c_to_raw_str(cur.path)
+            self.vendor_id[i] = cur.vendor_id
+            self.product_id[i] = cur.product_id
+            self.release_number[i] = cur.release_number
+            val = _c_to_raw_str(cur.manufacturer_string)
+            self.manufacturer_string[i] = strings.setdefault(val, val)
+            val = _c_to_raw_str(cur.product_string)
+            self.product_string[i] = strings.setdefault(val, val)
+            val = _c_to_raw_str(cur.serial_number)
+            self.serial_number[i] = strings.setdefault(val, val)
+            self.usage_page[i] = cur.usage_page
+            self.usage[i] = cur.usage
+            self.interface_number[i] = cur.interface_number
+            cur = cur.next
+
+    def __len__(self):
+        return len(self.vendor_id)
 
-    # Free the C memory
-    hidapi.hid_free_enumeration(start)
 
-    return result
+def _hid_enumerate(vendor_id=0, product_id=0):
+    """
+    Enumerates all the hid devices for VID:PID. Returns a `_DeviceTable` with
+    the information of each device.  If vid is 0, then match any vendor id.
+    Similarly, if pid is 0, match any product id. If both are zero, enumerate
+    all HID devices.
+    """
+    start = hidapi.hid_enumerate(vendor_id, product_id)
+
+    try:
+        return _DeviceTable(start)
+    finally:
+        # Free the C memory
+        hidapi.hid_free_enumeration(start)
 
 
 if __name__ == "__main__":